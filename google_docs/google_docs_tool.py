@@ -1,17 +1,300 @@
-import requests
+import asyncio
+import functools
+import gzip
+import hashlib
+import os
+import random
+import threading
+import weakref
+import aiohttp
+import orjson
+from cachetools import TTLCache
 from shared.composio_tools.lib.tool import Tool,Action
-from pydantic import BaseModel, Field
-from typing import Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Dict, Tuple, TypeVar
 from fastapi import UploadFile, File
 
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
+
+
+T = TypeVar("T")
+
+# One ClientSession per event loop, so connections are pooled and kept alive
+# across calls instead of paying a TCP+TLS handshake per request. Each entry
+# also holds the async generator that closes the session and drops the entry
+# when its loop shuts down (see _session_guard).
+_SESSIONS: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncIterator[None]]] = {}
+
+# Connection pool bounds for each session. Google's front ends keep idle
+# connections open for a while, so hold on to ours rather than redoing the
+# TCP+TLS handshake for bursts spaced a few seconds apart.
+_MAX_CONNECTIONS = 128
+_MAX_CONNECTIONS_PER_HOST = 64
+_KEEPALIVE_TIMEOUT = 60.0
+
+# uvloop (libuv) cuts per-syscall overhead on the shared background loop.
+# Set GOOGLE_DOCS_UVLOOP=0 to fall back to the stdlib loop.
+_USE_UVLOOP = uvloop is not None and os.environ.get("GOOGLE_DOCS_UVLOOP", "1") != "0"
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+async def _session_guard(
+    loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession
+) -> AsyncIterator[None]:
+    # Once started, the loop tracks this generator and closes it from
+    # shutdown_asyncgens(), which asyncio.run() and asyncio.Runner call on
+    # exit. That runs the finally block on the still-running loop, so sessions
+    # opened by callers of execute_async() are closed with their loop.
+    try:
+        yield
+    finally:
+        entry = _SESSIONS.get(loop)
+        if entry is not None and entry[0] is session:
+            del _SESSIONS[loop]
+        await session.close()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    entry = _SESSIONS.get(loop)
+    if entry is None or entry[0].closed:
+        connector = aiohttp.TCPConnector(
+            limit=_MAX_CONNECTIONS,
+            limit_per_host=_MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        guard = _session_guard(loop, session)
+        entry = _SESSIONS[loop] = (session, guard)
+        await guard.__anext__()
+    return entry[0]
+
+
+async def _close_session() -> None:
+    entry = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        # Running the guard's finally block closes the session
+        await entry[1].aclose()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    # The sync execute() wrappers share a single long-lived loop running in a
+    # daemon thread. Unlike asyncio.run(), this keeps the pooled session (and
+    # its open connections) alive between calls and also works when the caller
+    # is itself running inside an event loop.
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = uvloop.new_event_loop() if _USE_UVLOOP else asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="google-docs-io", daemon=True
+            ).start()
+        return _loop
+
+
+def _run(coro: Awaitable[T]) -> T:
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+_DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+_DRIVE_UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
+_GOOGLE_DOCUMENT_MIME_TYPE = "application/vnd.google-apps.document"
+
+# JSON bodies larger than this are gzip-compressed before sending. Responses
+# are already requested compressed: aiohttp sends Accept-Encoding and decodes
+# gzip (and br, when Brotli is installed) transparently.
+_GZIP_MIN_BYTES = 1024
+
+# 429 and 503 mean the request was turned away before it was processed, so
+# they are safe to retry for any method. Other gateway/server errors may
+# arrive after a POST has taken effect (e.g. a document was created), so
+# those are only retried for idempotent GETs.
+_RETRY_STATUSES = frozenset({429, 503})
+_IDEMPOTENT_RETRY_STATUSES = _RETRY_STATUSES | {500, 502, 504}
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 32.0
+_BACKOFF_JITTER = 0.5
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(_BACKOFF_CAP, max(0.0, float(retry_after)))
+        except ValueError:
+            # HTTP-date form; fall back to backoff
+            pass
+    return min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt) + random.random() * _BACKOFF_JITTER
+
+
+async def _docs_request(
+    method: str,
+    url: str,
+    headers: dict,
+    json: Optional[Any] = None,
+    params: Optional[dict] = None,
+    data: Optional[Any] = None,
+    retry: bool = True,
+) -> Tuple[int, Any]:
+    """
+    Send a request through the pooled session and return (status, decoded body).
+    Bodies that are not JSON are returned as text.
+
+    Rate-limited (429/503) responses, and for GETs other transient server
+    errors, are retried up to _MAX_ATTEMPTS times, honouring Retry-After
+    (capped at _BACKOFF_CAP) when the server sends it and otherwise backing
+    off exponentially with jitter. Pass retry=False for streamed bodies,
+    which cannot be replayed.
+    """
+    if json is not None:
+        # orjson encodes straight to bytes, several times faster than the
+        # stdlib encoder aiohttp would otherwise use
+        data = orjson.dumps(json)
+        headers = {**headers, "Content-Type": "application/json"}
+        if len(data) > _GZIP_MIN_BYTES:
+            # Level 1 is enough: JSON text compresses well even at the fastest setting
+            data = gzip.compress(data, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+    session = await _get_session()
+    attempts = _MAX_ATTEMPTS if retry else 1
+    retry_statuses = _IDEMPOTENT_RETRY_STATUSES if method == "GET" else _RETRY_STATUSES
+    for attempt in range(attempts):
+        async with session.request(
+            method, url, headers=headers, params=params, data=data
+        ) as response:
+            if response.status not in retry_statuses or attempt == attempts - 1:
+                body = await response.read()
+                if not body:
+                    return response.status, None
+                try:
+                    return response.status, orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Gateways answer some 5xx with HTML; keep the status and
+                    # hand back the text rather than failing on the parse
+                    return response.status, body.decode("utf-8", "replace")
+            delay = _retry_delay(response, attempt)
+        await asyncio.sleep(delay)
+
+
+class GoogleDocsAPIError(Exception):
+    """
+    Raised when a Google API call fails in a way the caller cannot safely
+    treat as an empty result.
+    """
+
+    def __init__(self, status: int, body: Any):
+        super().__init__(f"Google API request failed with status {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+def docs_action(fn: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """
+    Wrap an action's execute_async so it only has to return its response_data.
+
+    The payload's "success" flag becomes execution_details.executed, and any
+    exception is reported as a failed execution instead of propagating.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(self, req, authorisation_data: dict, *args, **kwargs) -> dict:
+        try:
+            response_data = await fn(self, req, authorisation_data, *args, **kwargs)
+        except Exception as e:
+            return {
+                "execution_details": {"executed": False},
+                "response_data": {"success": False, "error": str(e)},
+            }
+        return {
+            "execution_details": {"executed": bool(response_data.get("success"))},
+            "response_data": response_data,
+        }
+
+    return wrapper
+
+
+def _insert_text_request(text: str, index: int = 1) -> dict:
+    return {"insertText": {"location": {"index": index}, "text": text}}
+
+
+# Title -> document_id lookups, shared across calls. Keys include a hash of the
+# Authorization header so that different accounts never see each other's ids.
+_DOCUMENT_ID_CACHE: "TTLCache[Tuple[str, str], str]" = TTLCache(maxsize=4096, ttl=300)
+_document_id_cache_lock = threading.Lock()
+
+
+def _authorization(headers: dict) -> str:
+    # headers is a plain dict, but HTTP header names are case-insensitive
+    for name, value in headers.items():
+        if name.lower() == "authorization":
+            return value or ""
+    return ""
+
 
+def _document_cache_key(title: str, headers: dict) -> Optional[Tuple[str, str]]:
+    # Without a credential there is nothing to tell accounts apart, so such
+    # lookups are never cached
+    token = _authorization(headers)
+    if not token:
+        return None
+    return title, hashlib.blake2b(token.encode("utf-8"), digest_size=8).hexdigest()
 
-class CreateDocumentRequest(BaseModel):
+
+def _remember_document_id(title: str, headers: dict, document_id: str) -> None:
+    key = _document_cache_key(title, headers)
+    if key is None:
+        return
+    with _document_id_cache_lock:
+        _DOCUMENT_ID_CACHE[key] = document_id
+
+
+def _cached_document_lookup(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    Serve repeated title lookups from _DOCUMENT_ID_CACHE. Only hits are cached,
+    so a miss is always re-checked against the API before a document is created.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(self, title: str, headers: dict, base_url: str) -> str:
+        key = _document_cache_key(title, headers)
+        if key is None:
+            return await fn(self, title, headers, base_url)
+
+        with _document_id_cache_lock:
+            document_id = _DOCUMENT_ID_CACHE.get(key)
+        if document_id:
+            return document_id
+
+        document_id = await fn(self, title, headers, base_url)
+        if document_id:
+            with _document_id_cache_lock:
+                _DOCUMENT_ID_CACHE[key] = document_id
+        return document_id
+
+    return wrapper
+
+
+
+class _RequestModel(BaseModel):
+    # Requests are never mutated after validation, so they are frozen
+    model_config = ConfigDict(frozen=True)
+
+
+class CreateDocumentRequest(_RequestModel):
     title: Optional[str] = Field(None, description="Title of the new Google Docs document")
     text: Optional[str] = Field(None, description="Initial text to insert into the document")
 
 class CreateDocumentResponse(BaseModel):
-    
+    success: bool = Field(
+        ..., description="Indicates whether the document was successfully created"
+    )
     document_details: dict = Field(None, description="Details of the newly created document")
 
 class CreateDocument(Action):
@@ -23,79 +306,72 @@ class CreateDocument(Action):
     def display_name(self) -> str:
         return "Create Document"
 
-    @property
-    def request_schema(self) -> BaseModel:
-        return CreateDocumentRequest
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return CreateDocumentResponse
+    request_schema = CreateDocumentRequest
+    response_schema = CreateDocumentResponse
 
-    def execute(self, req: CreateDocumentRequest, authorisation_data: Dict) -> CreateDocumentResponse:
-        try:
-            headers = authorisation_data.get("headers", {})
-            base_url = authorisation_data.get("base_url", "https://docs.googleapis.com")
-            create_url = f"{base_url}/v1/documents"
-
-            # Create a new document
-            document_response = requests.post(create_url, headers=headers, json={"title": req.title})
-            if document_response.status_code != 200:
-                return CreateDocumentResponse(success=False)
-
-            document = document_response.json()
-            document_id = document.get('documentId')
-
-            # If text is provided, insert it into the document
-            if req.text:
-                update_url = f"{base_url}/v1/documents/{document_id}:batchUpdate"
-                requests_body = {
-                "title": req.title,
-                "body": {
-                    "content": [
-                        {
-                            "paragraph": {
-                                "elements": [
-                                    {
-                                        "textRun": {
-                                            "content": req.text
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    ]
-                }
-            }
-                response = requests.post(update_url, headers=headers, json=requests_body)
-                if response.status_code == 200:
-                 return {
-                    "execution_details": {"executed": True},
-                    "response_data": {"success": response.json()},
-                }
-                else:
-                 return {
-                    "execution_details": {"executed": False},
-                    "response_data": {"success": response.json()}
-                }
+    def execute(self, req: CreateDocumentRequest, authorisation_data: Dict) -> dict:
+        return _run(self.execute_async(req, authorisation_data))
 
-        except Exception as e:
-            return {
-                "execution_details": {"executed": False},
-                "response_data": {"success": False, "error": str(e)},
-            }
+    @docs_action
+    async def execute_async(self, req: CreateDocumentRequest, authorisation_data: Dict) -> dict:
+        headers = authorisation_data.get("headers", {})
+        base_url = authorisation_data.get("base_url", "https://docs.googleapis.com")
+        create_url = f"{base_url}/v1/documents"
+
+        # Create a new document; the title travels with the create call itself
+        status, document = await _docs_request("POST", create_url, headers, json={"title": req.title})
+        if status != 200:
+            return {"success": False, "error": document}
+
+        document_id = document.get('documentId')
+
+        # If text is provided, insert it with a single batchUpdate. Any further
+        # edits (styles etc.) belong in this same requests array rather than
+        # in additional round-trips.
+        if req.text:
+            update_url = f"{base_url}/v1/documents/{document_id}:batchUpdate"
+            data = {"requests": [_insert_text_request(req.text)]}
+            status, result = await _docs_request("POST", update_url, headers, json=data)
+            if status != 200:
+                return {"success": False, "document_details": document, "error": result}
 
+        return {"success": True, "document_details": document}
 
 
-class AppendTextToDocumentRequest(BaseModel):
+
+class TextStyle(_RequestModel):
+    bold: Optional[bool] = Field(None, description="Make the appended text bold")
+    italic: Optional[bool] = Field(None, description="Make the appended text italic")
+    underline: Optional[bool] = Field(None, description="Underline the appended text")
+    font_size: Optional[float] = Field(None, description="Font size of the appended text, in points")
+
+
+# (TextStyle attribute, Docs API field mask, textStyle payload factory)
+_STYLE_SPECS = (
+    ("bold", "bold", lambda v: {"bold": v}),
+    ("italic", "italic", lambda v: {"italic": v}),
+    ("underline", "underline", lambda v: {"underline": v}),
+    ("font_size", "fontSize", lambda v: {"fontSize": {"magnitude": v, "unit": "PT"}}),
+)
+
+
+class AppendTextToDocumentRequest(_RequestModel):
     document_id: str = Field(
         ...,
         description="The unique identifier of the Google Docs document to which the text will be appended. This ID can be extracted from the document's URL or using Google Drive API.",
-        example="1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
+        examples=["1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"]
     )
     text_to_append: str = Field(
         ...,
         description="The plain text to append to the document.",
-        example="This is some text that will be appended."
+        examples=["This is some text that will be appended."]
+    )
+    text_style: Optional[TextStyle] = Field(
+        None, description="Optional styling applied to the appended text"
+    )
+    coalesce: bool = Field(
+        False,
+        description="Send this append together with other appends to the same document made within a short window, as a single API call. Each call waits for that window (50 ms) before its batch is sent, so this only pays off when appends are made concurrently.",
     )
 
 class AppendTextToDocumentResponse(BaseModel):
@@ -104,6 +380,149 @@ class AppendTextToDocumentResponse(BaseModel):
     )
 
 
+def _utf16_len(text: str) -> int:
+    # Docs API indexes count UTF-16 code units, not code points
+    return len(text.encode("utf-16-le")) // 2
+
+
+class _AppendBatch:
+    def __init__(self, url: str, headers: dict):
+        self.url = url
+        self.headers = headers
+        # (text, style requests ranged from index 1, caller's future)
+        self.entries: List[Tuple[str, list, asyncio.Future]] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def requests(self) -> list:
+        # Each append inserts at index 1, so the most recent one ends up first
+        # in the document. Build the combined text in that order and move each
+        # entry's style ranges to where its text lands.
+        texts = []
+        style_requests = []
+        offset = 0
+        for text, styles, _ in reversed(self.entries):
+            for style in styles:
+                update = style["updateTextStyle"]
+                text_range = update["range"]
+                style_requests.append({
+                    "updateTextStyle": {
+                        **update,
+                        "range": {
+                            "startIndex": text_range["startIndex"] + offset,
+                            "endIndex": text_range["endIndex"] + offset,
+                        },
+                    }
+                })
+            texts.append(text)
+            offset += _utf16_len(text)
+        return [_insert_text_request("".join(texts))] + style_requests
+
+
+class _AppendBuffer:
+    """
+    Write-behind buffer for AppendTextToDocument.
+
+    Appends to the same document arriving within `window` seconds are sent as
+    one batchUpdate, or sooner once `max_bytes` of text is pending. Each caller
+    still awaits the (status, body) of the batch its text went out in. At most
+    one batch per document is in flight; the next one waits for it, so batches
+    reach the document in the order they were started.
+    """
+
+    def __init__(self, window: float = 0.05, max_bytes: int = 64 * 1024):
+        self.window = window
+        self.max_bytes = max_bytes
+        self._batches: Dict[Tuple[str, str], _AppendBatch] = {}
+        self._in_flight: set = set()
+        # Most recently started batch task for each document
+        self._tails: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def append(self, url: str, headers: dict, text: str, style_requests: list) -> Tuple[int, Any]:
+        token = _authorization(headers)
+        if not token:
+            # Batches are sent with one caller's headers, so appends that
+            # can't be attributed to a credential are never merged
+            data = {"requests": [_insert_text_request(text)] + style_requests}
+            return await _docs_request("POST", url, headers, json=data)
+
+        loop = asyncio.get_running_loop()
+        key = (url, token)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _AppendBatch(url, headers)
+            batch.timer = loop.call_later(self.window, self._send, key)
+
+        future = loop.create_future()
+        batch.entries.append((text, style_requests, future))
+        batch.size += len(text.encode("utf-8"))
+        if batch.size >= self.max_bytes:
+            self._send(key)
+        return await future
+
+    async def flush(self) -> None:
+        """
+        Send everything still pending and wait for all batches to complete.
+        """
+        for key in list(self._batches):
+            self._send(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _send(self, key: Tuple[str, str]) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        previous = self._tails.get(key)
+        task = asyncio.get_running_loop().create_task(self._post(batch, previous))
+        self._tails[key] = task
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        task.add_done_callback(lambda done: self._drop_tail(key, done))
+
+    def _drop_tail(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        if self._tails.get(key) is task:
+            del self._tails[key]
+
+    async def _post(self, batch: _AppendBatch, previous: Optional[asyncio.Task]) -> None:
+        if previous is not None:
+            # asyncio.wait never raises, so a failed earlier batch doesn't block this one
+            await asyncio.wait({previous})
+        futures = [future for _, _, future in batch.entries]
+        try:
+            result = await _docs_request(
+                "POST", batch.url, batch.headers, json={"requests": batch.requests()}
+            )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+
+# Like the HTTP sessions, buffers are tied to the event loop their timers and
+# futures run on.
+_APPEND_BUFFERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AppendBuffer]" = weakref.WeakKeyDictionary()
+
+
+def _get_append_buffer() -> _AppendBuffer:
+    loop = asyncio.get_running_loop()
+    buffer = _APPEND_BUFFERS.get(loop)
+    if buffer is None:
+        buffer = _APPEND_BUFFERS[loop] = _AppendBuffer()
+    return buffer
+
+
+async def _flush_appends() -> None:
+    buffer = _APPEND_BUFFERS.get(asyncio.get_running_loop())
+    if buffer is not None:
+        await buffer.flush()
+
+
 class AppendTextToDocument(Action):
     """
     Appends text to an existing document in Google Docs.
@@ -113,104 +532,64 @@ class AppendTextToDocument(Action):
     def display_name(self) -> str:
         return "Append Text to Document"
 
-    @property
-    def request_schema(self) -> BaseModel:
-        return AppendTextToDocumentRequest
-
-    @property
-    def response_schema(self) -> BaseModel:
-        return AppendTextToDocumentResponse
+    request_schema = AppendTextToDocumentRequest
+    response_schema = AppendTextToDocumentResponse
     
-    def create_style_requests(self, text_style, text_length: int):
-        style_requests = []
-
-        if text_style.bold is not None:
-            style_requests.append({
-                "updateTextStyle": {
-                    "range": {"startIndex": 1, "endIndex": text_length + 1},
-                    "textStyle": {"bold": text_style.bold},
-                    "fields": "bold"
-                }
-            })
-
-        if text_style.italic is not None:
-            style_requests.append({
-                "updateTextStyle": {
-                    "range": {"startIndex": 1, "endIndex": text_length + 1},
-                    "textStyle": {"italic": text_style.italic},
-                    "fields": "italic"
-                }
-            })
-
-        if text_style.underline is not None:
-            style_requests.append({
-                "updateTextStyle": {
-                    "range": {"startIndex": 1, "endIndex": text_length + 1},
-                    "textStyle": {"underline": text_style.underline},
-                    "fields": "underline"
-                }
-            })
-
-        if text_style.font_size is not None:
-            style_requests.append({
+    def create_style_requests(self, text_style: TextStyle, text_length: int) -> list:
+        text_range = {"startIndex": 1, "endIndex": text_length + 1}
+        return [
+            {
                 "updateTextStyle": {
-                    "range": {"startIndex": 1, "endIndex": text_length + 1},
-                    "textStyle": {
-                        "fontSize": {"magnitude": text_style.font_size, "unit": "PT"}
-                    },
-                    "fields": "fontSize"
+                    "range": text_range,
+                    "textStyle": make_style(value),
+                    "fields": field_name,
                 }
-            })
-
-        return style_requests
-
+            }
+            for attr, field_name, make_style in _STYLE_SPECS
+            if (value := getattr(text_style, attr)) is not None
+        ]
 
     def execute(self, req: AppendTextToDocumentRequest, authorisation_data: dict, text_length: int):
-        try:
-            headers = authorisation_data.get("headers", {})
-            base_url = authorisation_data.get(
-                "base_url", "https://docs.googleapis.com"
-            )
-            url = f"{base_url}/v1/documents/{req.document_id}:batchUpdate"
+        """
+        With req.coalesce set, this blocks for at least the buffer's window
+        before the batch is sent. Appends only get coalesced when several
+        threads call execute() at once, or when execute_async() is awaited
+        concurrently; a single sequential caller just pays the delay.
+        """
+        return _run(self.execute_async(req, authorisation_data, text_length))
+
+    @docs_action
+    async def execute_async(self, req: AppendTextToDocumentRequest, authorisation_data: dict, text_length: int) -> dict:
+        headers = authorisation_data.get("headers", {})
+        base_url = authorisation_data.get(
+            "base_url", "https://docs.googleapis.com"
+        )
+        url = f"{base_url}/v1/documents/{req.document_id}:batchUpdate"
 
+        style_requests = []
+        if req.text_style:
+            style_requests = self.create_style_requests(req.text_style, text_length)
+
+        if req.coalesce:
+            # Hand the append to the write-behind buffer, which sends it along
+            # with any other appends to this document made in the same window
+            status, result = await _get_append_buffer().append(
+                url, headers, req.text_to_append, style_requests
+            )
+        else:
             # Prepare the request body to append text to the document
-            data = {
-                "requests": [
-                    {
-                        "insertText": {
-                            "location": {"index": 1},
-                            "text": req.text_to_append,
-                        }
-                    }
-                ]
-            }
-            if req.text_style:
-                style_requests = self.create_style_requests(req.text_style, text_length)
-                data['requests'].extend(style_requests)
+            data = {"requests": [_insert_text_request(req.text_to_append)] + style_requests}
 
             # Send the request to append text
-            response = requests.post(url, headers=headers, json=data)
+            status, result = await _docs_request("POST", url, headers, json=data)
 
-            if response.status_code == 200:
-                return {
-                    "execution_details": {"executed": True},
-                    "response_data": {"success": response.json()},
-                }
-            else:
-                return {
-                    "execution_details": {"executed": False},
-                    "response_data": {"success": response.json()}
-                }
-
-        except Exception as e:
-            return {
-                "execution_details": {"executed": False},
-                "response_data": {"success": False, "error": str(e)},
-            }
+        if status == 200:
+            return {"success": True}
+        return {"success": False, "error": result}
 
     
 
-class CreateDocumentFromTemplateRequest(BaseModel):
+class CreateDocumentFromTemplateRequest(_RequestModel):
     template_document_id: str = Field(
         ..., description="ID of the template document to create a new document from"
     )
@@ -236,83 +615,79 @@ class CreateDocumentFromTemplate(Action):
     Create a new document based on a template document and replace placeholder variables.
     """
 
+    # Upper bound on concurrent copy+replace pipelines in execute_many, to stay
+    # clear of the Docs/Drive per-user rate limits.
+    max_concurrency = 16
+
     @property
     def display_name(self) -> str:
         return "Create Document from Template"
 
-    @property
-    def request_schema(self) -> BaseModel:
-        return CreateDocumentFromTemplateRequest
-
-    @property
-    def response_schema(self) -> BaseModel:
-        return CreateDocumentFromTemplateResponse
+    request_schema = CreateDocumentFromTemplateRequest
+    response_schema = CreateDocumentFromTemplateResponse
 
     def execute(
         self, req: CreateDocumentFromTemplateRequest, authorisation_data: dict
     ) -> dict:
-        try:
-            headers = authorisation_data.get("headers", {})
-            base_url = authorisation_data.get(
-                "base_url", "https://docs.googleapis.com"
-            )
-            url = f"{base_url}/v1/documents/{req.template_document_id}:copy"
+        return _run(self.execute_async(req, authorisation_data))
 
-            # Prepare the request body to copy the template document
-            data = {
-                "title": req.new_document_title,  # Set the title for the new document
-            }
+    @docs_action
+    async def execute_async(
+        self, req: CreateDocumentFromTemplateRequest, authorisation_data: dict
+    ) -> dict:
+        headers = authorisation_data.get("headers", {})
 
-            # Send the request to copy the template document
-            response = requests.post(url, headers=headers, json=data)
-
-            if response.status_code == 200:
-                new_document = response.json()
-                # Replace placeholder variables in the new document
-                if new_document:
-                    success = self.replace_placeholders(
-                        new_document, req.replacements, headers
-                    )
-                    if success:
-                        return {
-                            "execution_details": {"executed": True},
-                            "response_data": {"success": True, "new_document": new_document},
-                        }
-                    else:
-                        return {
-                            "execution_details": {"executed": False},
-                            "response_data": {"success": False, "new_document": new_document},
-                        }
-                else:
-                    return {
-                        "execution_details": {"executed": False},
-                        "response_data": {"success": False, "new_document": new_document},
-                    }
-            else:
-                return {
-                    "execution_details": {"executed": False},
-                    "response_data": {"success": False, "new_document": new_document},
-                }
+        # Documents are copied through Drive; the Docs API has no copy method
+        url = f"{_DRIVE_FILES_URL}/{req.template_document_id}/copy"
 
-        except Exception as e:
-            return {
-                "execution_details": {"executed": False},
-                "response_data": {"success": False, "document_id": "", "error": str(e)},
-            }
-        
-    
-   
+        # Prepare the request body to copy the template document
+        data = {
+            "name": req.new_document_title,  # Set the title for the new document
+        }
 
-    def replace_placeholders(self, new_document: dict, replacements: Dict[str, str], headers: dict) -> bool:
+        # Send the request to copy the template document, asking only for the new id
+        status, new_document = await _docs_request(
+            "POST", url, headers, json=data, params={"fields": "id"}
+        )
+        if status != 200:
+            return {"success": False, "new_document": None, "error": new_document}
+
+        # Replace placeholder variables in the new document
+        new_document_id = new_document.get("id")
+        status, result = await self.replace_placeholders(
+            new_document_id, req.replacements, headers
+        )
+        if status != 200:
+            return {"success": False, "new_document": new_document_id, "error": result}
+        return {"success": True, "new_document": new_document_id}
+
+    async def execute_many(
+        self, reqs: List[CreateDocumentFromTemplateRequest], authorisation_data: dict
+    ) -> List[dict]:
+        """
+        Create one document per request concurrently. Results are returned in the
+        same order as reqs, each shaped like the result of execute().
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(req: CreateDocumentFromTemplateRequest) -> dict:
+            async with semaphore:
+                return await self.execute_async(req, authorisation_data)
+
+        return await asyncio.gather(*[run_one(req) for req in reqs])
+
+
+    async def replace_placeholders(self, document_id: str, replacements: Dict[str, str], headers: dict) -> Tuple[int, Any]:
         base_url = "https://docs.googleapis.com"
-        document_id = new_document.get('documentId')
         url = f"{base_url}/v1/documents/{document_id}:batchUpdate"
         requests_list = []
 
-        # Create requests for each replacement
-        for placeholder, replacement in replacements.items():
-            # Find the placeholder in the document and replace it
-            # This is a simplified example. You may need to implement a more robust search and replace logic
+        # Create requests for each replacement. Docs applies them in order, so
+        # longer placeholders go first: otherwise "NAME" would clobber part of
+        # "NAME_FULL" before that one gets a chance to match.
+        for placeholder, replacement in sorted(
+            replacements.items(), key=lambda item: -len(item[0])
+        ):
             requests_list.append({
                 "replaceAllText": {
                     "containsText": {
@@ -328,14 +703,26 @@ class CreateDocumentFromTemplate(Action):
             "requests": requests_list
         }
 
-        # Send the request to make the replacements
-        response = requests.post(url, headers=headers, json=data)
-
-        # Check if the replacements were successful
-        return response.status_code == 200
+        # Send the request to make the replacements, returning (status, body)
+        return await _docs_request("POST", url, headers, json=data)
         
 
-class UploadDocumentRequest(BaseModel):
+_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def _escape_drive_query(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await file.read(_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+class UploadDocumentRequest(_RequestModel):
     file_name: Optional[str] = Field(None, description="Name to assign to the uploaded file in Google Docs")
 
 
@@ -355,52 +742,48 @@ class UploadDocument(Action):
     def display_name(self) -> str:
         return "Upload Document"
 
-    @property
-    def request_schema(self) -> BaseModel:
-        return UploadDocumentRequest
-
-    @property
-    def response_schema(self) -> BaseModel:
-        return UploadDocumentResponse
+    request_schema = UploadDocumentRequest
+    response_schema = UploadDocumentResponse
 
     def execute(self, req: UploadDocumentRequest, authorisation_data: dict, file: UploadFile = File(...)):
-        try:
-            headers = authorisation_data.get("headers", {})
-            base_url = authorisation_data.get("base_url", "https://docs.googleapis.com")
-            upload_url = f"{base_url}/v1/documents:upload"
-
-            # Read the uploaded file
-            file_content = file.file.read()
-
-            # Prepare the request body to upload the document
-            data = {
-                "content": file_content.decode("utf-8"),
-                "fileName": req.file_name,
-            }
-
-            # Send the request to upload the document
-            response = requests.post(upload_url, headers=headers, json=data)
-
-            if response.status_code == 200:
-                return {
-                    "execution_details": {"executed": True},
-                    "response_data": {"success": True, "document_id": response.json().get("id")},
-                }
-            else:
-                return {
-                    "execution_details": {"executed": False},
-                    "response_data": {"success": False, "document_id": None},
-                }
-
-        except Exception as e:
-            return {
-                "execution_details": {"executed": False},
-                "response_data": {"success": False, "document_id": None, "error": str(e)},
-            }
-
-
-
-class CreateDocumentFromTextRequest(BaseModel):
+        return _run(self.execute_async(req, authorisation_data, file))
+
+    @docs_action
+    async def execute_async(self, req: UploadDocumentRequest, authorisation_data: dict, file: UploadFile = File(...)) -> dict:
+        headers = authorisation_data.get("headers", {})
+
+        # Upload through Drive's multipart endpoint: a JSON metadata part
+        # followed by the raw file, streamed in chunks straight from the
+        # upload so the body is never held in memory or decoded. Drive
+        # converts it to a Google Docs document on the way in.
+        metadata = {
+            "name": req.file_name or file.filename,
+            "mimeType": _GOOGLE_DOCUMENT_MIME_TYPE,
+        }
+        body = aiohttp.MultipartWriter("related")
+        body.append_json(metadata)
+        body.append(
+            _iter_upload(file),
+            {"Content-Type": file.content_type or "application/octet-stream"},
+        )
+
+        # Send the request to upload the document
+        status, result = await _docs_request(
+            "POST",
+            _DRIVE_UPLOAD_URL,
+            headers,
+            params={"uploadType": "multipart", "fields": "id"},
+            data=body,
+            retry=False,
+        )
+
+        if status == 200:
+            return {"success": True, "document_id": result.get("id")}
+        return {"success": False, "document_id": None, "error": result}
+
+
+
+class CreateDocumentFromTextRequest(_RequestModel):
     document_content: str = Field(..., description="Content of the document to create. Limited HTML is supported.")
     title: str = Field(..., description="Title of the document")
 
@@ -421,66 +804,41 @@ class CreateDocumentFromText(Action):
     def display_name(self) -> str:
         return "Create Document from Text"
 
-    @property
-    def request_schema(self) -> BaseModel:
-        return CreateDocumentFromTextRequest
-
-    @property
-    def response_schema(self) -> BaseModel:
-        return CreateDocumentFromTextResponse
+    request_schema = CreateDocumentFromTextRequest
+    response_schema = CreateDocumentFromTextResponse
 
     def execute(self, req: CreateDocumentFromTextRequest, authorisation_data: dict):
-        try:
-            headers = authorisation_data.get("headers", {})
-            base_url = authorisation_data.get(
-                "base_url", "https://docs.googleapis.com"
-            )
-            url = f"{base_url}/v1/documents"
-
-            # Prepare the request body to create a new document from text
-            data = {
-                "title": req.title,
-                "body": {
-                    "content": [
-                        {
-                            "paragraph": {
-                                "elements": [
-                                    {
-                                        "textRun": {
-                                            "content": req.document_content
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    ]
-                }
-            }
-
-            # Send the request to create the document
-            response = requests.post(url, headers=headers, json=data)
-
-            if response.status_code == 200:
-                document_id = response.json().get("id")
-                return {
-                    "execution_details": {"executed": True},
-                    "response_data": {"success": True, "document_id": document_id},
-                }
-            else:
-                return {
-                    "execution_details": {"executed": False},
-                    "response_data": {"success": False, "document_id": None},
-                }
+        return _run(self.execute_async(req, authorisation_data))
+
+    @docs_action
+    async def execute_async(self, req: CreateDocumentFromTextRequest, authorisation_data: dict) -> dict:
+        headers = authorisation_data.get("headers", {})
+        base_url = authorisation_data.get(
+            "base_url", "https://docs.googleapis.com"
+        )
+        url = f"{base_url}/v1/documents"
 
-        except Exception as e:
-            return {
-                "execution_details": {"executed": False},
-                "response_data": {"success": False, "document_id": None, "error": str(e)},
-            }
+        # documents.create only honours the title, so create the document
+        # first, asking only for its id
+        status, result = await _docs_request(
+            "POST", url, headers, json={"title": req.title}, params={"fields": "documentId"}
+        )
+        if status != 200:
+            return {"success": False, "document_id": None, "error": result}
+        document_id = result.get("documentId")
+
+        # Then insert the content with a single batchUpdate
+        update_url = f"{base_url}/v1/documents/{document_id}:batchUpdate"
+        data = {"requests": [_insert_text_request(req.document_content)]}
+        status, result = await _docs_request("POST", update_url, headers, json=data)
+        if status != 200:
+            return {"success": False, "document_id": document_id, "error": result}
+
+        return {"success": True, "document_id": document_id}
         
 
 
-class FindOrCreateDocumentRequest(BaseModel):
+class FindOrCreateDocumentRequest(_RequestModel):
     document_title: str = Field(..., description="Title of the document to find or create")
 
 
@@ -500,72 +858,70 @@ class FindOrCreateDocument(Action):
     def display_name(self) -> str:
         return "Find or Create Document"
 
-    @property
-    def request_schema(self) -> BaseModel:
-        return FindOrCreateDocumentRequest
-
-    @property
-    def response_schema(self) -> BaseModel:
-        return FindOrCreateDocumentResponse
+    request_schema = FindOrCreateDocumentRequest
+    response_schema = FindOrCreateDocumentResponse
 
     def execute(self, req: FindOrCreateDocumentRequest, authorisation_data: dict):
-        try:
-            headers = authorisation_data.get("headers", {})
-            base_url = authorisation_data.get(
-                "base_url", "https://docs.googleapis.com"
-            )
-
-            # Check if the document exists
-            document_id = self.find_document(req.document_title, headers, base_url)
-
-            if document_id:
-                return {
-                    "execution_details": {"executed": True},
-                    "response_data": {"success": True, "document_id": document_id},
-                }
-            else:
-                # If the document does not exist, create a new one
-                new_document_id = self.create_document(req.document_title, headers, base_url)
-                if new_document_id:
-                    return {
-                        "execution_details": {"executed": True},
-                        "response_data": {"success": True, "document_id": new_document_id},
-                    }
-                else:
-                    return {
-                        "execution_details": {"executed": False},
-                        "response_data": {"success": False, "document_id": None},
-                    }
-
-        except Exception as e:
-            return {
-                "execution_details": {"executed": False},
-                "response_data": {"success": False, "document_id": None, "error": str(e)},
-            }
+        return _run(self.execute_async(req, authorisation_data))
+
+    @docs_action
+    async def execute_async(self, req: FindOrCreateDocumentRequest, authorisation_data: dict) -> dict:
+        headers = authorisation_data.get("headers", {})
+        base_url = authorisation_data.get(
+            "base_url", "https://docs.googleapis.com"
+        )
+
+        # Check if the document exists, and create a new one if it does not
+        document_id = await self.find_document(req.document_title, headers, base_url)
+        if not document_id:
+            document_id = await self.create_document(req.document_title, headers, base_url)
+
+        return {"success": bool(document_id), "document_id": document_id or None}
+
+    @_cached_document_lookup
+    async def find_document(self, title: str, headers: dict, base_url: str) -> str:
+        # The Docs API has no search endpoint; look the title up through Drive,
+        # asking only for the id of the first match
+        params = {
+            "q": (
+                f"name = '{_escape_drive_query(title)}'"
+                f" and mimeType = '{_GOOGLE_DOCUMENT_MIME_TYPE}'"
+                " and trashed = false"
+            ),
+            "fields": "files(id)",
+            "pageSize": 1,
+        }
+        status, result = await _docs_request("GET", _DRIVE_FILES_URL, headers, params=params)
 
-    def find_document(self, title: str, headers: dict, base_url: str) -> str:
-        # Query the API to find the document by title
-        url = f"{base_url}/v1/documents"
-        params = {"title": title}
-        response = requests.get(url, headers=headers, params=params)
+        # Only a successful search may come back empty-handed; anything else
+        # (missing scope, exhausted rate limit) must not look like "not found",
+        # or the caller would create a duplicate document
+        if status != 200:
+            raise GoogleDocsAPIError(status, result)
 
-        if response.status_code == 200:
-            documents = response.json().get("documents", [])
-            if documents:
-                return documents[0].get("id")
+        files = result.get("files", [])
+        if files:
+            return files[0].get("id")
         return ""
 
-    def create_document(self, title: str, headers: dict, base_url: str) -> str:
+    async def create_document(self, title: str, headers: dict, base_url: str) -> str:
         # Prepare the request body to create a new document
         data = {"title": title}
         url = f"{base_url}/v1/documents"
 
-        # Send the request to create the document
-        response = requests.post(url, headers=headers, json=data)
+        # Send the request to create the document, asking only for its id
+        status, result = await _docs_request(
+            "POST", url, headers, json=data, params={"fields": "documentId"}
+        )
 
-        if response.status_code == 200:
-            return response.json().get("id")
-        return ""
+        if status != 200:
+            raise GoogleDocsAPIError(status, result)
+
+        document_id = result.get("documentId")
+        if document_id:
+            # Replace any stale entry so the next lookup resolves to this document
+            _remember_document_id(title, headers, document_id)
+        return document_id
 
 
 
@@ -583,18 +939,48 @@ class GoogleDocs3(Tool):
     Connect to Google Docs to perform various document-related actions.
     """
 
-    def actions(self) -> list:
-        return [
-                AppendTextToDocument,
-                CreateDocumentFromTemplate,
-                UploadDocument,
-                CreateDocumentFromText,
-                FindOrCreateDocument,
-                CreateDocument,
-               ]
-
-    def triggers(self) -> list:
-        return []
+    _ACTIONS = (
+        AppendTextToDocument,
+        CreateDocumentFromTemplate,
+        UploadDocument,
+        CreateDocumentFromText,
+        FindOrCreateDocument,
+        CreateDocument,
+    )
+    _TRIGGERS = ()
+
+    def actions(self) -> tuple:
+        return self._ACTIONS
+
+    def triggers(self) -> tuple:
+        return self._TRIGGERS
+
+    async def flush(self) -> None:
+        """
+        Send any coalesced appends still buffered on the running event loop.
+        """
+        await _flush_appends()
+
+    async def aclose(self) -> None:
+        """
+        Flush buffered appends and close the pooled HTTP session used by
+        actions on the running event loop.
+
+        Loops driven by asyncio.run() close their session on exit without
+        this. A loop that is closed without shutdown_asyncgens() must call
+        aclose() first, or its session and sockets are leaked.
+        """
+        await _flush_appends()
+        await _close_session()
+
+    def close(self) -> None:
+        """
+        Flush buffered appends and close the pooled HTTP session used by the
+        sync execute() wrappers.
+        """
+        if _loop is not None and not _loop.is_closed():
+            _run(_flush_appends())
+            _run(_close_session())
 
 
 __all__ = ["GoogleDocs3"]
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("shared.composio_tools.lib.tool")
+
+from aiohttp import web  # noqa: E402
+import google_docs_tool  # noqa: E402
+from google_docs_tool import (  # noqa: E402
+    AppendTextToDocument,
+    TextStyle,
+    _AppendBatch,
+    _AppendBuffer,
+    _docs_request,
+)
+
+
+def test_append_batch_concatenates_latest_append_first():
+    batch = _AppendBatch("url", {})
+    for text in ["first", "second", "third"]:
+        batch.entries.append((text, [], None))
+
+    requests = batch.requests()
+
+    assert requests == [
+        {"insertText": {"location": {"index": 1}, "text": "thirdsecondfirst"}}
+    ]
+
+
+def test_append_batch_shifts_style_ranges_by_utf16_offset():
+    action = AppendTextToDocument()
+    bold = TextStyle(bold=True)
+    italic = TextStyle(italic=True)
+    batch = _AppendBatch("url", {})
+    # Appended first, so it ends up last in the combined text
+    batch.entries.append(("ab", action.create_style_requests(bold, 2), None))
+    # Each emoji is one code point but two UTF-16 code units
+    batch.entries.append(("\U0001F600\U0001F600", [], None))
+    batch.entries.append(("xyz", action.create_style_requests(italic, 3), None))
+
+    requests = batch.requests()
+
+    assert requests[0]["insertText"]["text"] == "xyz\U0001F600\U0001F600ab"
+    assert requests[1]["updateTextStyle"]["textStyle"] == {"italic": True}
+    assert requests[1]["updateTextStyle"]["range"] == {"startIndex": 1, "endIndex": 4}
+    assert requests[2]["updateTextStyle"]["textStyle"] == {"bold": True}
+    assert requests[2]["updateTextStyle"]["range"] == {"startIndex": 8, "endIndex": 10}
+
+
+def test_append_buffer_sends_batches_for_a_document_in_order(monkeypatch):
+    sent = []
+
+    async def fake_request(method, url, headers, json=None, **kwargs):
+        text = json["requests"][0]["insertText"]["text"]
+        # The first batch is slow, so a second one must wait for it
+        await asyncio.sleep(0.05 if text == "a" else 0)
+        sent.append(text)
+        return 200, {}
+
+    monkeypatch.setattr(google_docs_tool, "_docs_request", fake_request)
+
+    async def run():
+        buffer = _AppendBuffer(window=0.01)
+        headers = {"Authorization": "Bearer token"}
+        first = asyncio.ensure_future(buffer.append("url", headers, "a", []))
+        await asyncio.sleep(0.02)
+        second = asyncio.ensure_future(buffer.append("url", headers, "b", []))
+        await buffer.flush()
+        return await first, await second
+
+    assert asyncio.run(run()) == ((200, {}), (200, {}))
+    assert sent == ["a", "b"]
+
+
+def test_append_buffer_batches_by_case_insensitive_credential(monkeypatch):
+    sent = []
+
+    async def fake_request(method, url, headers, json=None, **kwargs):
+        sent.append((json["requests"][0]["insertText"]["text"], headers))
+        return 200, {}
+
+    monkeypatch.setattr(google_docs_tool, "_docs_request", fake_request)
+
+    async def run():
+        buffer = _AppendBuffer(window=0.01)
+        await asyncio.gather(
+            buffer.append("url", {"Authorization": "Bearer one"}, "a", []),
+            buffer.append("url", {"authorization": "Bearer one"}, "b", []),
+            buffer.append("url", {"Authorization": "Bearer two"}, "c", []),
+            buffer.append("url", {}, "d", []),
+        )
+
+    asyncio.run(run())
+
+    assert sorted(text for text, _ in sent) == ["ba", "c", "d"]
+    assert dict(sent)["c"] == {"Authorization": "Bearer two"}
+
+
+def test_docs_request_returns_status_for_non_json_error_body():
+    async def bad_gateway(request):
+        return web.Response(
+            status=502, text="<html>bad gateway</html>", content_type="text/html"
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/documents", bad_gateway)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        port = runner.addresses[0][1]
+        try:
+            return await _docs_request(
+                "POST", f"http://127.0.0.1:{port}/v1/documents", {}, json={"title": "t"}
+            )
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == (502, "<html>bad gateway</html>")